@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""첨부 파일 보관 단계 테스트: 로컬 HTTP 스텁 서버(aiohttp)를 CDN 삼아 종료 작업(run_close_job)을 돌린다.
+
+스텁은 요청마다 --delay 만큼 늦게 응답하고 동시 처리 중인 요청 수의 최대값을 센다.
+채널에는 고유 파일, 내용이 같은 파일(중복), 알려진 크기 초과, 받다가 크기 초과(길이 헤더 없음), 404 를 섞는다.
+
+확인 항목
+  - 동시 다운로드 수 ≤ --concurrency
+  - 저장소 파일 수 == 고유 내용 수(중복 제거), 크기 초과/실패는 저장 안 됨
+  - ticket_attachments 기록과 HTML 의 로컬 링크, 채널 삭제까지 완료
+  - 크기를 모르는(0) 첨부도 받는 대로 티켓 합계 상한에 걸림, 빈 파일의 두 번째 사본은 중복으로 기록
+
+    python bench/bench_attach.py --files 40 --dups 10 --concurrency 1 4 8
+"""
+import os, sys, time, asyncio, argparse, sqlite3, tempfile
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT); sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+TMP=tempfile.mkdtemp(prefix="ticketbench-")
+os.environ.setdefault("DB_PATH", os.path.join(TMP, "attach.db"))
+os.environ.setdefault("ARCHIVE_DIR", os.path.join(TMP, "archive"))
+from aiohttp import web
+import main as bot_main
+from fakes import RestSim, FakeGuild, FakeMember, FakeMessage, FakeAttachment, FakeTextChannel
+
+MAX_BYTES=256*1024
+
+class Stub:
+    def __init__(self, delay):
+        self.delay=delay; self.inflight=0; self.peak=0; self.requests=0
+    async def handle(self, req):
+        self.requests+=1; self.inflight+=1; self.peak=max(self.peak, self.inflight)
+        try:
+            await asyncio.sleep(self.delay)
+            name=req.match_info["name"]
+            if name=="missing": return web.Response(status=404)
+            if name.startswith("empty"): return web.Response(body=b"")
+            if name=="stream-big":  # 길이 헤더 없이 상한보다 길게
+                r=web.StreamResponse(); r.enable_chunked_encoding(); await r.prepare(req)
+                for _ in range(MAX_BYTES//8192+2): await r.write(b"x"*8192)
+                await r.write_eof(); return r
+            key=name.split("-")[0]  # "c7-2" 와 "c7-5" 는 같은 내용
+            return web.Response(body=(key.encode()*4096)[:32*1024+len(key)])
+        finally:
+            self.inflight-=1
+
+async def run_once(a, conc, base_url, stub):
+    arch=os.path.join(TMP, f"archive-c{conc}")
+    bot_main.attachments=bot_main.AttachmentArchiver(arch, conc, MAX_BYTES, 64*MAX_BYTES, 10)
+    guild=FakeGuild(RestSim(0.0)); bot_main.bot.get_guild=lambda gid: guild
+    user=FakeMember(guild, "user")
+    ch=FakeTextChannel(guild, "ticket-item-0001"); guild.channels[ch.id]=ch
+    atts=[FakeAttachment(f"{base_url}/c{i}-0", f"pay{i}.png", 32*1024) for i in range(a.files)]
+    atts+=[FakeAttachment(f"{base_url}/c{i%a.files}-{i+1}", f"dup{i}.png", 32*1024) for i in range(a.dups)]
+    atts+=[FakeAttachment(f"{base_url}/declared-big", "huge.mp4", MAX_BYTES*4),
+           FakeAttachment(f"{base_url}/stream-big", "liar.png", 1000),
+           FakeAttachment(f"{base_url}/missing", "gone.png", 10)]
+    for i in range(0, len(atts), 3): ch.messages.append(FakeMessage(ch, user, f"증빙 {i}", attachments=atts[i:i+3]))
+    tid=conc*1000
+    job=bot_main.CloseJob(0, guild.id, ch.id, tid, user.id)
+    old_dir=bot_main.ARCHIVE_DIR; bot_main.ARCHIVE_DIR=arch
+    stub.peak=0; stub.requests=0
+    t=time.perf_counter()
+    try: await bot_main.run_close_job(job)
+    finally: bot_main.ARCHIVE_DIR=old_dir
+    wall=time.perf_counter()-t
+    await bot_main.attachments.close()
+
+    files=[f for d in os.listdir(os.path.join(arch, "_files")) if d!="tmp" for f in os.listdir(os.path.join(arch, "_files", d))]
+    conn=sqlite3.connect(bot_main.DB_PATH)
+    st=dict(conn.execute("SELECT status, COUNT(*) FROM ticket_attachments WHERE ticket_id=? GROUP BY status", (tid,)).fetchall())
+    conn.close()
+    with open(os.path.join(arch, str(guild.id), f"{tid}.html"), encoding="utf-8") as f: page=f.read()
+    leftovers=os.listdir(os.path.join(arch, "_files", "tmp"))
+    ok=(stub.peak<=conc and len(files)==a.files and st.get("stored",0)==a.files and st.get("dedup",0)==a.dups
+        and st.get("too_large",0)==2 and st.get("failed",0)==1 and "_files/" in page and ch.deleted and not leftovers)
+    print(f"  conc={conc:>2}  wall={wall:6.2f}s  requests={stub.requests:>3} peak={stub.peak:>2}  "
+          f"files={len(files)}  {st}  {'OK' if ok else 'FAIL'}")
+    return ok
+
+async def run_budget(base_url):
+    # 티켓 상한 = 파일 2.5개 분량, 크기 0 으로 알려진 파일 5개 → 2개만 저장. 빈 파일 두 개는 저장 1 + 중복 1
+    arch=os.path.join(TMP, "archive-budget"); body=len("u0")*4096  # 스텁 본문 = 키 × 4096
+    arc=bot_main.AttachmentArchiver(arch, 1, MAX_BYTES, int(body*2.5), 10)
+    refs=[bot_main.AttachmentRef(i, 1, f"e{i}.txt", f"{base_url}/empty-{i}", 0) for i in (1, 2)]
+    refs+=[bot_main.AttachmentRef(10+i, 1, f"u{i}.png", f"{base_url}/u{i}-0", 0) for i in range(5)]
+    try: res=await arc.archive(99_000, 1, refs)
+    finally: await arc.close()
+    st=[status for _,status,_ in res]
+    ok=st==["stored", "dedup", "stored", "stored", "too_large", "too_large", "too_large"]
+    print(f"  budget(크기 0): {st}  {'OK' if ok else 'FAIL'}")
+    return ok
+
+async def main_async(a):
+    await bot_main.init_db()
+    stub=Stub(a.delay); app=web.Application(); app.router.add_get("/{name}", stub.handle)
+    runner=web.AppRunner(app); await runner.setup()
+    site=web.TCPSite(runner, "127.0.0.1", 0); await site.start()
+    port=site._server.sockets[0].getsockname()[1]
+    print(f"files={a.files} dups={a.dups} delay={a.delay*1000:.0f}ms stub=127.0.0.1:{port}")
+    try: return all([await run_once(a, c, f"http://127.0.0.1:{port}", stub) for c in a.concurrency]
+                    +[await run_budget(f"http://127.0.0.1:{port}")])
+    finally: await runner.cleanup()
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=40)
+    ap.add_argument("--dups", type=int, default=10)
+    ap.add_argument("--delay", type=float, default=0.05)
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    a=ap.parse_args()
+    try: ok=asyncio.run(main_async(a))
+    finally: bot_main.dbpool.close()
+    print("OK" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
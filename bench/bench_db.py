@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""DB 계층 벤치마크: 호출마다 sqlite3.connect(이전) vs 봇이 실제로 쓰는 경로(현재).
+
+동시에 N개의 '상호작용'(설정 조회 → 티켓 조회 → 활동 갱신)을 띄우고
+상호작용 지연(p50/p95/p99/max)과 이벤트 루프 지연(하트비트 지연)을 잰다.
+현재 경로는 설정 캐시 → TicketIndex 조회 → ActivityBuffer 병합이고, 남은 활동은
+마지막에 기록(flush)을 마저 기다리고 그 시간도 따로 보고한다.
+
+    python bench/bench_db.py --interactions 500 --tickets 5000
+"""
+import os, sys, time, sqlite3, asyncio, argparse, tempfile, statistics
+import datetime as dt
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def pct(xs, p):
+    xs=sorted(xs); return xs[min(len(xs)-1, int(len(xs)*p/100))]
+
+# ---- 이전 방식(매 호출 connect, 이벤트 루프에서 동기 실행) ----
+def legacy_helpers(path):
+    def db(): return sqlite3.connect(path)
+    def get_settings(gid):
+        conn=db(); cur=conn.cursor()
+        cur.execute("SELECT * FROM guild_settings WHERE guild_id=?",(gid,))
+        r=cur.fetchone(); conn.close(); return r
+    def ticket_from_channel(chid):
+        conn=db(); cur=conn.cursor()
+        cur.execute("SELECT * FROM tickets WHERE channel_id=?",(chid,))
+        r=cur.fetchone(); conn.close(); return r
+    def update_ticket_activity(chid):
+        conn=db(); cur=conn.cursor()
+        cur.execute("UPDATE tickets SET last_activity_at=? WHERE channel_id=?",
+                    (dt.datetime.now(dt.timezone.utc).isoformat(), chid))
+        conn.commit(); conn.close()
+    async def interaction(gid, chid):
+        get_settings(gid); ticket_from_channel(chid); update_ticket_activity(chid)
+    return interaction
+
+def current_helpers(main):
+    async def interaction(gid, chid):
+        await main.get_settings(gid)
+        if main.ticket_index.get(chid): main.activity.touch(chid)
+    return interaction
+
+def seed(path, tickets, guilds=20):
+    conn=sqlite3.connect(path)
+    now=dt.datetime.now(dt.timezone.utc).isoformat()
+    conn.executemany("INSERT OR REPLACE INTO guild_settings(guild_id,category_id) VALUES(?,?)",
+                     [(g, 1000+g) for g in range(guilds)])
+    conn.executemany("""INSERT INTO tickets(guild_id,channel_id,opener_id,type_value,opened_at,last_activity_at,status)
+                        VALUES(?,?,?,?,?,?,'open')""",
+                     [(i%guilds, 10_000+i, i, "item", now, now) for i in range(tickets)])
+    conn.commit(); conn.close()
+
+async def drive(interaction, n, tickets, guilds=20):
+    lags=[]; stop=asyncio.Event()
+    async def heartbeat():
+        while not stop.is_set():
+            t=time.perf_counter(); await asyncio.sleep(0.005)
+            lags.append(time.perf_counter()-t-0.005)
+    hb=asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.02)
+    lat=[]
+    # 모든 상호작용이 t0에 동시 도착했다고 보고 완료까지의 시간을 잰다(대기열 지연 포함)
+    t0=time.perf_counter()
+    async def one(i):
+        await interaction(i%guilds, 10_000+(i*7919)%tickets)
+        lat.append(time.perf_counter()-t0)
+    await asyncio.gather(*(one(i) for i in range(n)))
+    wall=time.perf_counter()-t0
+    stop.set(); await hb
+    return lat, lags, wall
+
+def report(name, lat, lags, wall):
+    ms=lambda x: f"{x*1000:8.2f}"
+    print(f"{name:8} p50={ms(pct(lat,50))} p95={ms(pct(lat,95))} p99={ms(pct(lat,99))} "
+          f"max={ms(max(lat))} ms | loop-lag max={ms(max(lags or [0]))} "
+          f"mean={ms(statistics.fmean(lags or [0]))} ms | wall={wall:.2f}s")
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--interactions", type=int, default=500)
+    ap.add_argument("--tickets", type=int, default=5000)
+    ap.add_argument("--pool", type=int, default=4)
+    a=ap.parse_args()
+
+    tmp=tempfile.mkdtemp(prefix="ticketbench-")
+    path=os.path.join(tmp, "bench.db")
+    os.environ["DB_PATH"]=path; os.environ["DB_POOL_SIZE"]=str(a.pool)
+    import main as bot_main
+
+    async def run():
+        await bot_main.init_db()
+        seed(path, a.tickets)
+        report("before", *await drive(legacy_helpers(path), a.interactions, a.tickets))
+        await bot_main.load_ticket_index()
+        report("after", *await drive(current_helpers(bot_main), a.interactions, a.tickets))
+        act=bot_main.activity
+        t=time.perf_counter()
+        if act._kick: await act._kick  # 크기 초과로 이미 시작된 기록도 포함
+        await act.flush()
+        print(f"flush    {act.written}행/{act.flushes}회 {(time.perf_counter()-t)*1000:8.2f} ms (병합 {act.absorbed}건)")
+    asyncio.run(run())
+    bot_main.dbpool.close()
+
+if __name__ == "__main__":
+    main()
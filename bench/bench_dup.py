@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""중복 티켓 방지 스트레스 테스트: 같은 유저의 동시 제출(더블 클릭/연타)을 가짜 길드로 몰아 넣는다.
+
+유저마다 --burst 번 동시에 유형 선택 → 사유 제출을 실행하고,
+create_text_channel 호출 수와 DB의 유저별 열린 티켓 수가 정확히 1인지 확인한다.
+마지막 유저는 다른 프로세스가 이미 연 티켓(DB 에만 있음)을 흉내 내 UNIQUE 인덱스 경로를 확인한다.
+
+    python bench/bench_dup.py --users 200 --burst 5 --latency 0.05
+"""
+import os, sys, time, asyncio, argparse, sqlite3, tempfile
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT); sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(prefix="ticketbench-"), "dup.db"))
+os.environ.setdefault("ARCHIVE_DIR", "")
+import main as bot_main
+from fakes import RestSim, FakeGuild, FakeMember, FakeInteraction
+
+class BenchSelect(bot_main.TicketTypeSelect, template=r"ticket_type_select"):
+    def __init__(self, rows, value):
+        super().__init__(rows); self._bench_value=value
+    @property
+    def values(self): return [self._bench_value]
+
+async def open_ticket(guild, user, rows, reason="stress"):
+    inter=FakeInteraction(guild, user)
+    await BenchSelect(rows, rows[0].value).callback(inter)
+    modal=inter.response.modal
+    if modal is None: return inter.sent
+    inter2=FakeInteraction(guild, user)
+    await modal.parent_callback(inter2, reason)
+    return inter2.sent
+
+async def run(a):
+    await bot_main.init_db()
+    rest=RestSim(a.latency); guild=FakeGuild(rest)
+    staff=guild.add_role("staff"); cat=guild.add_category()
+    await bot_main.upsert_settings(guild.id, category_id=cat.id, support_role_id=staff.id)
+    await bot_main.add_type(guild.id, "item", "아이템 구매", "", None, 1)
+    rows=await bot_main.list_types(guild.id)
+    await bot_main.load_ticket_index()
+
+    users=[FakeMember(guild, f"user{i}") for i in range(a.users)]
+    # 다른 프로세스가 먼저 연 티켓(이 프로세스 인덱스에는 없음)
+    ghost=users[-1]
+    await bot_main.dbpool.run(bot_main._insert_ticket, guild.id, 1, ghost.id, "item", "other-process")
+
+    t=time.perf_counter()
+    await asyncio.gather(*(open_ticket(guild, u, rows) for u in users for _ in range(a.burst)))
+    wall=time.perf_counter()-t
+
+    creates=rest.calls[f"create:{guild.id}"]; deletes=rest.calls[f"delete:{guild.id}"]
+    conn=sqlite3.connect(bot_main.DB_PATH)
+    per_user=conn.execute("""SELECT MAX(n) FROM (SELECT COUNT(*) n FROM tickets
+                             WHERE guild_id=? AND status='open' GROUP BY opener_id)""",(guild.id,)).fetchone()[0]
+    opened=conn.execute("SELECT COUNT(*) FROM tickets WHERE guild_id=? AND status='open'",(guild.id,)).fetchone()[0]
+    conn.close()
+    live=sum(1 for c in guild.channels.values() if c not in (cat,))
+    print(f"users={a.users} burst={a.burst} submits={a.users*a.burst} wall={wall:.2f}s")
+    print(f"  create_text_channel={creates} (DB 경합으로 정리된 채널 delete={deletes}) live channels={live}")
+    print(f"  open tickets={opened} max per user={per_user}")
+    ok = per_user==1 and opened==a.users and live==a.users-1 and creates-deletes==a.users-1
+    print("  OK" if ok else "  FAIL")
+    return ok
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--users", type=int, default=200)
+    ap.add_argument("--burst", type=int, default=5)
+    ap.add_argument("--latency", type=float, default=0.02)
+    a=ap.parse_args()
+    ok=asyncio.run(run(a)); bot_main.dbpool.close()
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""tickets 조회 벤치마크: 마이그레이션 v1(인덱스 없음) vs 최신(인덱스 적용).
+
+행 수별로 채널 조회 / (길드, 개설자) 열린 티켓 검사 / 열린 티켓 전체 적재 시간을 잰다.
+
+    python bench/bench_lookup.py --rows 10000 100000 1000000
+"""
+import os, sys, time, random, sqlite3, argparse, tempfile
+import datetime as dt
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(prefix="ticketbench-"), "unused.db"))
+import main as bot_main
+
+QUERIES = {
+    "channel": ("SELECT * FROM tickets WHERE channel_id=?", lambda r, n: (10_000+r.randrange(n),)),
+    "dup-check": ("SELECT channel_id FROM tickets WHERE guild_id=? AND opener_id=? AND status='open' LIMIT 1",
+                  lambda r, n: (r.randrange(50), r.randrange(n))),
+}
+
+LOAD_OPEN = """SELECT ticket_id,guild_id,channel_id,opener_id,type_value,claimed_by,last_activity_at,opened_at
+               FROM tickets WHERE status='open' ORDER BY last_activity_at"""
+
+def build(path, n, guilds=50, open_ratio=0.02):
+    conn=sqlite3.connect(path)
+    bot_main._m1_base(conn); conn.execute("PRAGMA user_version=1"); conn.commit()
+    now=dt.datetime.now(dt.timezone.utc).isoformat()
+    r=random.Random(1)
+    batch=[]
+    for i in range(n):
+        st="open" if r.random()<open_ratio else "closed"
+        batch.append((i%guilds, 10_000+i, i, "item", now, now, st))
+        if len(batch)>=50_000:
+            conn.executemany("""INSERT INTO tickets(guild_id,channel_id,opener_id,type_value,opened_at,last_activity_at,status)
+                                VALUES(?,?,?,?,?,?,?)""", batch); batch.clear()
+    if batch:
+        conn.executemany("""INSERT INTO tickets(guild_id,channel_id,opener_id,type_value,opened_at,last_activity_at,status)
+                            VALUES(?,?,?,?,?,?,?)""", batch)
+    conn.commit(); return conn
+
+def measure(conn, n, k):
+    out={}
+    for name,(sql,argf) in QUERIES.items():
+        r=random.Random(2)
+        t=time.perf_counter()
+        for _ in range(k): conn.execute(sql, argf(r, n)).fetchall()
+        out[name]=(time.perf_counter()-t)/k*1e6
+    # 시작 시 열린 티켓 적재(_open_tickets 와 같은 조건/정렬, v1 스키마에도 있는 컬럼만)
+    t=time.perf_counter(); conn.execute(LOAD_OPEN).fetchall(); out["load-open"]=(time.perf_counter()-t)*1e6
+    return out
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    ap.add_argument("--lookups", type=int, default=200)
+    a=ap.parse_args()
+    for n in a.rows:
+        path=os.path.join(tempfile.mkdtemp(prefix="ticketbench-"), "lookup.db")
+        conn=build(path, n)
+        before=measure(conn, n, a.lookups)
+        t=time.perf_counter(); bot_main._migrate(conn, backup=False); mig=time.perf_counter()-t
+        after=measure(conn, n, a.lookups)
+        conn.close()
+        print(f"rows={n:>9,}  (migration {mig:.2f}s)")
+        for name in before:
+            unit="us/lookup" if name in QUERIES else "us total"
+            print(f"  {name:10} before={before[name]:12.1f}  after={after[name]:10.1f}  {unit}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""샤딩 모드 로컬 테스트(토큰/실제 게이트웨이 불필요).
+
+1) DB: 길드를 샤드 공식대로 워커 프로세스에 배정하고, 워커들은 같은 SQLite DB 에 동시에 티켓을 연다.
+  - 이전 실행에서 남은 열린 티켓을 각 워커가 자기 샤드 길드 것만 적재(foreign=0)
+  - 동시 쓰기에서 실패 없이 모든 티켓이 열림(DB 합계 일치)
+2) 런처: main.launch_shards 가 띄운 워커(실제 AutoShardedBot)가 가짜 게이트웨이(fakes.FakeGateway)에 붙는다.
+  - 샤드마다 IDENTIFY 1번, 길드는 샤드 공식대로 배정
+  - 워커를 한꺼번에 죽여도 백오프(2초) 뒤 모두 거의 동시에 재시작(한 워커 대기가 다른 워커 감시를 막지 않음)
+  - 바로 또 죽으면 백오프 증가(4초), SHARD_HEALTHY_SEC 넘게 돈 뒤 죽으면 다시 2초
+  - SIGTERM 이면 워커를 정리하고 런처가 0 으로 종료
+
+    python bench/bench_shard.py --shards 8 --procs 4 --guilds 32 --users 20
+"""
+import os, sys, json, time, signal, asyncio, collections, argparse, sqlite3, tempfile, subprocess, itertools, runpy, urllib.request
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE=os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT); sys.path.insert(0, HERE)
+
+def guild_ids(n):
+    # 연속 값 << 22 → 샤드가 고르게 돌아가며 배정됨
+    base=10**16>>22
+    return [(base+i)<<22 for i in range(n)]
+
+async def worker(a):
+    import main as bot_main
+    import fakes
+    from fakes import RestSim, FakeGuild, FakeMember
+    # 실제 스노플레이크처럼 프로세스끼리 ID 가 겹치지 않게
+    fakes._ids=itertools.count(10**17+a.index*10**12)
+    from bench_dup import open_ticket
+    gids=[int(x) for x in a.gids.split(",") if x]
+    await bot_main.init_db()
+    await bot_main.load_ticket_index()
+    loaded=len(bot_main.ticket_index)
+    foreign=sum(1 for r in bot_main.ticket_index if not bot_main.owns_guild(r.guild_id))
+
+    rest=RestSim(a.latency); guilds=[]
+    for gid in gids:
+        g=FakeGuild(rest, gid=gid)
+        staff=g.add_role("staff"); cat=g.add_category()
+        await bot_main.upsert_settings(g.id, category_id=cat.id, support_role_id=staff.id)
+        await bot_main.add_type(g.id, "item", "아이템 구매", "", None, 1)
+        guilds.append((g, await bot_main.list_types(g.id)))
+
+    t=time.perf_counter()
+    res=await asyncio.gather(*(open_ticket(g, FakeMember(g, f"user{i}"), rows)
+                              for g,rows in guilds for i in range(a.users)), return_exceptions=True)
+    wall=time.perf_counter()-t
+    ok=sum(1 for r in res if isinstance(r, list) and any("생성됐어" in x for x in r))
+    print(json.dumps({"shards": os.environ["SHARD_IDS"], "guilds": len(gids), "loaded": loaded, "foreign": foreign,
+                      "opened": ok, "errors": len(res)-ok, "wall": wall}), flush=True)
+    bot_main.dbpool.close()
+
+def parent(a):
+    db=os.path.join(tempfile.mkdtemp(prefix="ticketbench-"), "shard.db")
+    env=dict(os.environ, DB_PATH=db, ARCHIVE_DIR="", SHARD_COUNT=str(a.shards), SHARD_PROCS="1")
+    os.environ.update(DB_PATH=db, ARCHIVE_DIR="")
+    import main as bot_main
+    # 런처처럼 마이그레이션은 먼저 한 번, 그리고 "이전 실행"의 열린 티켓을 모든 길드에 하나씩
+    conn=sqlite3.connect(db); bot_main._migrate(conn, backup=False)
+    gids=guild_ids(a.guilds)
+    for gid in gids: bot_main._insert_ticket(conn, gid, gid+1, 1, "item", "previous run")
+    conn.commit(); conn.close()
+
+    plan=bot_main.shard_plan(a.shards, a.procs)
+    procs=[]
+    t=time.perf_counter()
+    for i,shards in enumerate(plan):
+        mine=[g for g in gids if bot_main.shard_of(g, a.shards) in shards]  # 게이트웨이 배정
+        procs.append(subprocess.Popen([sys.executable, os.path.abspath(__file__), "--worker", "--index", str(i),
+                                       "--gids", ",".join(map(str, mine)), "--users", str(a.users),
+                                       "--latency", str(a.latency)],
+                                      env=dict(env, SHARD_IDS=",".join(map(str, shards))),
+                                      stdout=subprocess.PIPE, text=True))
+    outs=[]
+    for p in procs:
+        out,_=p.communicate()
+        lines=[l for l in out.splitlines() if l.startswith("{")]
+        outs.append(json.loads(lines[-1]) if p.returncode==0 and lines else None)
+    wall=time.perf_counter()-t
+
+    conn=sqlite3.connect(db)
+    opened=conn.execute("SELECT COUNT(*) FROM tickets WHERE status='open'").fetchone()[0]
+    conn.close()
+    total=a.guilds*a.users
+    print(f"shards={a.shards} procs={len(plan)} guilds={a.guilds} users/guild={a.users} wall={wall:.2f}s "
+          f"throughput={total/wall:.0f} opens/s")
+    ok=all(outs)
+    for o in outs:
+        if o is None: print("  worker 실패"); continue
+        print(f"  shards[{o['shards']}] guilds={o['guilds']} loaded={o['loaded']} foreign={o['foreign']} "
+              f"opened={o['opened']} errors={o['errors']} wall={o['wall']:.2f}s")
+        ok=ok and o["foreign"]==0 and o["errors"]==0 and o["loaded"]==o["guilds"]
+    ok=ok and opened==total+a.guilds and sum(o["opened"] for o in outs if o)==total
+    print(f"  DB open tickets={opened} (기대 {total+a.guilds})")
+    print("  OK" if ok else "  FAIL")
+    return ok
+
+HEALTHY_SEC=4  # 런처 테스트용 SHARD_HEALTHY_SEC
+RESTART_SLACK=2.0  # 백오프 외 허용 지연(감시 주기 0.5초 + 프로세스 시작)
+
+def gateway_worker():
+    """런처가 띄우는 워커: main.py 를 그대로 __main__ 으로 실행하되 REST/게이트웨이 주소만 가짜로"""
+    url=os.environ["BENCH_GATEWAY"]
+    urllib.request.urlopen(f"{url}/bench/hello?pid={os.getpid()}&shards={os.environ['SHARD_IDS']}").read()
+    import discord, yarl
+    discord.http.Route.BASE=url+"/api/v10"
+    discord.gateway.DiscordWebSocket.DEFAULT_GATEWAY=yarl.URL(url.replace("http", "ws", 1)+"/gateway")
+    async def no_wait(self, shard_id, *, initial=False): pass  # 실제 게이트웨이의 IDENTIFY 간격(5초)은 생략
+    discord.Client.before_identify_hook=no_wait
+    runpy.run_path(os.path.join(ROOT, "main.py"), run_name="__main__")
+
+def launch(a):
+    import main as bot_main
+    bot_main.setup_logging()
+    sys.exit(bot_main.launch_shards(a.procs, [sys.executable, os.path.abspath(__file__), "--gateway-worker"]))
+
+async def launcher_run(a):
+    from fakes import FakeGateway
+    import main as bot_main
+    gids=guild_ids(a.guilds); plan=bot_main.shard_plan(a.shards, a.procs)
+    keys=[",".join(map(str, p)) for p in plan]
+    gw=await FakeGateway(gids).start()
+    db=os.path.join(tempfile.mkdtemp(prefix="ticketbench-"), "launch.db")
+    env=dict(os.environ, DB_PATH=db, ARCHIVE_DIR="", PERF_LOG="", METRICS_PORT="", DISCORD_TOKEN="bench",
+             SHARD_COUNT=str(a.shards), SHARD_IDS="", SHARD_PROCS=str(a.procs), SHARD_HEALTHY_SEC=str(HEALTHY_SEC),
+             LOG_FORMAT="json", BENCH_GATEWAY=gw.url)
+    proc=await asyncio.create_subprocess_exec(sys.executable, os.path.abspath(__file__), "--launch", "--procs", str(a.procs),
+                                              env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    ready_at={k: 0.0 for k in keys}; restarts=[]; tail=collections.deque(maxlen=40)
+    async def pump():
+        async for line in proc.stdout:
+            tail.append(line.decode(errors="replace").rstrip())
+            try: d=json.loads(line)
+            except ValueError: continue
+            if d.get("msg", "").startswith("[READY]"):
+                ready_at[",".join(str(x["shard"]) for x in d["shards"])]=time.monotonic()
+            elif d.get("msg", "").startswith("[LAUNCH]") and d["level"]=="WARNING": restarts.append(d["msg"])
+    pumper=asyncio.create_task(pump())
+    async def until(pred, timeout=30.0):
+        end=time.monotonic()+timeout
+        while not pred():
+            if time.monotonic()>end or proc.returncode is not None: return False
+            await asyncio.sleep(0.05)
+        return True
+    def last_hello(k): return max((h for h in gw.hellos if h[2]==k), default=None)
+    def hellos(k): return sum(1 for h in gw.hellos if h[2]==k)
+    def up(k):  # 지금 워커가 READY 까지 옴(샤드마다 그 뒤 IDENTIFY)
+        h=last_hello(k)
+        return bool(h) and ready_at[k]>h[0] and all(gw.identified_at.get(int(s), 0)>h[0] for s in k.split(","))
+    async def kill_and_wait(ks):
+        # 워커를 SIGKILL → 같은 샤드의 새 워커가 알려 올 때까지 걸린 시간
+        before={k: hellos(k) for k in ks}; t=time.monotonic()
+        for k in ks:
+            try: os.kill(last_hello(k)[1], signal.SIGKILL)
+            except ProcessLookupError: pass  # 이미 죽음(런처가 알아서 재시작)
+        ok=await until(lambda: all(hellos(k)>before[k] for k in ks), 30)
+        return ok, {k: (last_hello(k)[0]-t if hellos(k)>before[k] else None) for k in ks}
+
+    ok=True; lines=[]
+    t=time.perf_counter()
+    started=await until(lambda: all(up(k) for k in keys), 60)
+    lines.append(f"  start: 워커 {len(keys)}개 READY {time.perf_counter()-t:.2f}s")
+    want={s: {g for g in gids if bot_main.shard_of(g, a.shards)==s} for s in range(a.shards)}
+    assigned=started and all(gw.identifies[s]==1 and gw.sent[s]==want[s] for s in range(a.shards))
+    lines.append(f"  gateway: IDENTIFY {dict(sorted(gw.identifies.items()))} 길드 배정 {'일치' if assigned else '불일치'}")
+    ok=ok and started and assigned
+
+    if ok:
+        # 1) 모두 한꺼번에 죽임 → 전부 ~2초 뒤(직렬이면 마지막 워커는 2초×N)
+        r1,lat=await kill_and_wait(keys)
+        worst=max((v for v in lat.values() if v is not None), default=float("inf"))
+        lines.append("  kill all: 재시작 " + " ".join(f"[{k}]{v:.2f}s" for k,v in lat.items() if v is not None)
+                     + f" (기대 2~{2+RESTART_SLACK:.0f}s)")
+        ok=ok and r1 and min(lat.values())>=2-0.1 and worst<=2+RESTART_SLACK
+        k0=keys[0]
+        # 2) 재시작 직후 또 죽음 → 백오프 4초
+        r2,lat=await kill_and_wait([k0])
+        lines.append(f"  kill again: [{k0}] {lat[k0] or float('nan'):.2f}s (기대 4~{4+RESTART_SLACK:.0f}s)")
+        ok=ok and r2 and 4-0.1<=lat[k0]<=4+RESTART_SLACK
+        # 3) SHARD_HEALTHY_SEC 넘게 돈 뒤 죽음 → 백오프 초기화(2초)
+        await until(lambda: up(k0), 30)
+        await asyncio.sleep(max(0, last_hello(k0)[0]+HEALTHY_SEC+0.5-time.monotonic()))
+        r3,lat=await kill_and_wait([k0])
+        lines.append(f"  kill after healthy: [{k0}] {lat[k0] or float('nan'):.2f}s (기대 2~{2+RESTART_SLACK:.0f}s)")
+        ok=ok and r3 and 2-0.1<=lat[k0]<=2+RESTART_SLACK
+        back=await until(lambda: all(up(k) for k in keys), 60)
+        lines.append(f"  recovered: 모든 워커 재 IDENTIFY/READY {'정상' if back else '실패'} (IDENTIFY {dict(sorted(gw.identifies.items()))})")
+        ok=ok and back
+
+    # 4) SIGTERM → 워커 정리 후 0 으로 종료
+    pids=[last_hello(k)[1] for k in keys]
+    proc.send_signal(signal.SIGTERM)
+    try: rc=await asyncio.wait_for(proc.wait(), 30)
+    except asyncio.TimeoutError: proc.kill(); rc=None
+    alive=[]
+    for pid in pids:
+        try: os.kill(pid, 0); alive.append(pid)
+        except ProcessLookupError: pass
+    lines.append(f"  stop: 런처 종료 코드 {rc}, 남은 워커 {len(alive)}, 재시작 로그 {len(restarts)}건")
+    ok=ok and rc==0 and not alive and len(restarts)==len(keys)+2
+    pumper.cancel(); await gw.stop()
+    print(f"launcher shards={a.shards} procs={len(keys)} guilds={a.guilds}")
+    for l in lines: print(l)
+    if not ok: print("  --- 런처 로그(끝부분) ---", *tail, sep="\n")
+    print("  OK" if ok else "  FAIL")
+    return ok
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--shards", type=int, default=8)
+    ap.add_argument("--procs", type=int, default=4)
+    ap.add_argument("--guilds", type=int, default=32)
+    ap.add_argument("--users", type=int, default=20)
+    ap.add_argument("--latency", type=float, default=0.02)
+    ap.add_argument("--worker", action="store_true")
+    ap.add_argument("--gids", default="")
+    ap.add_argument("--index", type=int, default=0)
+    ap.add_argument("--no-launcher", action="store_true", help="런처/가짜 게이트웨이 테스트 생략")
+    ap.add_argument("--launch", action="store_true", help=argparse.SUPPRESS)
+    ap.add_argument("--gateway-worker", action="store_true", help=argparse.SUPPRESS)
+    a=ap.parse_args()
+    if a.gateway_worker: gateway_worker(); return
+    if a.launch: launch(a); return
+    if a.worker: asyncio.run(worker(a)); return
+    ok=parent(a)
+    if not a.no_launcher: ok=asyncio.run(launcher_run(a)) and ok
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
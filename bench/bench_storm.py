@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""상호작용 폭주 부하 테스트: 실제 핸들러를 가짜 Interaction/Guild/채널로 단계별로 몰아붙인다.
+
+단계
+  open     N명이 동시에 유형 선택(TicketTypeSelect.callback) → ReasonModal.on_submit → after_reason
+  claim    스태프가 모든 티켓을 동시에 담당(handle_claim)
+  message  티켓마다 M개 메시지 폭주(on_message)
+  close    개설자가 모두 닫기(handle_close) → 종료 대기열이 비워질 때까지(run_close_job)
+
+단계마다 지연 p50/p95/p99/max, 처리량, 이벤트 루프 지연(p99/max), DB 시간(DBPool), REST 호출/429 를 출력.
+지터는 고정 시드라 같은 인자면 같은 부하. --save 로 결과를 JSON 으로 남기고 --baseline 으로 비교해
+p95 나 처리량이 --tolerance 이상 나빠지면 종료 코드 1.
+
+    python bench/bench_storm.py --users 500 --latency 0.05 --jitter 0.05 --save storm.json
+    python bench/bench_storm.py --users 500 --latency 0.05 --jitter 0.05 --baseline storm.json
+"""
+import os, sys, json, time, asyncio, argparse, tempfile
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT); sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(prefix="ticketbench-"), "storm.db"))
+os.environ.setdefault("ARCHIVE_DIR", "")
+import main as bot_main
+from fakes import RestSim, FakeGuild, FakeMember, FakeMessage, FakeInteraction
+from bench_dup import BenchSelect
+
+# 디스코드 라우트별 대략적 한도(횟수, 초) — 채널 생성/삭제는 길드당, 메시지는 채널당
+DEFAULT_LIMITS = {"create": (50, 10.0), "delete": (50, 10.0), "send": (5, 5.0), "edit": (2, 600.0)}
+
+def pct(xs, p):
+    xs=sorted(xs); return xs[min(len(xs)-1, int(len(xs)*p/100))] if xs else 0.0
+
+class LoopLag:
+    """interval 마다 깨어나 예정보다 늦은 만큼을 이벤트 루프 지연으로 기록"""
+    def __init__(self, interval=0.01): self.interval=interval; self.samples=[]; self._task=None
+    async def _run(self):
+        while True:
+            t=time.perf_counter(); await asyncio.sleep(self.interval)
+            self.samples.append(time.perf_counter()-t-self.interval)
+    def start(self): self.samples=[]; self._task=asyncio.create_task(self._run())
+    async def stop(self):
+        self._task.cancel()
+        try: await self._task
+        except asyncio.CancelledError: pass
+        return self.samples
+
+def db_time() -> tuple[float, int]:
+    tot=n=0
+    for (name,_),h in bot_main.metrics._hists.items():
+        if name=="ticketbot_db_seconds": tot+=h[-2]; n+=h[-1]
+    return tot, n
+
+async def phase(name, coros, rest, extra_wait=None):
+    lag=LoopLag(); lag.start()
+    db0, q0 = db_time(); calls0=sum(rest.calls.values()); rl0=sum(rest.ratelimited.values())
+    lat=[]; errors=0
+    async def timed(c):
+        nonlocal errors
+        t=time.perf_counter()
+        try:
+            if await c is False: errors+=1
+        except Exception: errors+=1
+        lat.append(time.perf_counter()-t)
+    t=time.perf_counter()
+    await asyncio.gather(*(timed(c) for c in coros))
+    if extra_wait: await extra_wait()
+    wall=time.perf_counter()-t
+    lags=await lag.stop(); db1, q1 = db_time()
+    r={"phase": name, "n": len(lat), "errors": errors, "wall": wall, "throughput": len(lat)/wall if wall else 0.0,
+       "p50": pct(lat,50), "p95": pct(lat,95), "p99": pct(lat,99), "max": max(lat, default=0.0),
+       "lag_p99": pct(lags,99), "lag_max": max(lags, default=0.0), "db_time": db1-db0, "db_queries": q1-q0,
+       "rest": sum(rest.calls.values())-calls0, "rest_429": sum(rest.ratelimited.values())-rl0}
+    print(f"{name:8} n={r['n']:>6} err={errors:<3} {r['throughput']:8.1f}/s  wall={wall:6.2f}s  "
+          f"p50={r['p50']*1000:7.1f} p95={r['p95']*1000:7.1f} p99={r['p99']*1000:7.1f} max={r['max']*1000:7.1f}ms  "
+          f"lag p99={r['lag_p99']*1000:5.1f} max={r['lag_max']*1000:5.1f}ms  "
+          f"db={r['db_time']:.2f}s/{r['db_queries']}q  rest={r['rest']} 429={r['rest_429']}")
+    return r
+
+async def open_one(guild, user, rows):
+    inter=FakeInteraction(guild, user)
+    await BenchSelect(rows, rows[0].value).callback(inter)
+    modal=inter.response.modal
+    if modal is None: return False
+    modal.reason._value="부하 테스트"
+    inter2=FakeInteraction(guild, user)
+    await modal.on_submit(inter2)
+    return any("생성됐어" in x for x in inter2.sent)
+
+async def claim_one(guild, staff, ch):
+    inter=FakeInteraction(guild, staff, ch)
+    await bot_main.handle_claim(inter)
+    return any("담당자 지정" in x for x in inter.sent)
+
+async def message_one(guild, user, ch, i):
+    await bot_main.on_message(FakeMessage(ch, user, f"메시지 {i}"))
+
+async def close_one(guild, user, ch):
+    inter=FakeInteraction(guild, user, ch)
+    await bot_main.handle_close(inter)
+    return any("접수했어" in x for x in inter.sent)
+
+async def run(a):
+    bot_main.metrics.enabled=True  # DB 시간 집계(DBPool.run 은 호출 때마다 확인)
+    async def ready(): pass
+    bot_main.bot.wait_until_ready=ready
+    await bot_main.init_db()
+    rest=RestSim(a.latency, a.jitter, {} if a.no_limits else DEFAULT_LIMITS, seed=a.seed)
+    guild=FakeGuild(rest); bot_main.bot.get_guild=lambda gid: guild if gid==guild.id else None
+    bot_main.bot._connection.user=guild.me  # process_commands 의 자기 메시지 검사용
+    staff_role=guild.add_role("staff"); cat=guild.add_category()
+    staff=FakeMember(guild, "staff", roles=[staff_role])
+    await bot_main.upsert_settings(guild.id, category_id=cat.id, support_role_id=staff_role.id)
+    await bot_main.add_type(guild.id, "item", "아이템 구매", "", None, 1)
+    rows=await bot_main.list_types(guild.id)
+    await bot_main.load_ticket_index()
+    bot_main.close_queue.start()
+
+    users=[FakeMember(guild, f"user{i}") for i in range(a.users)]
+    print(f"users={a.users} messages/ticket={a.messages} latency={a.latency*1000:.0f}ms jitter={a.jitter*1000:.0f}ms "
+          f"limits={'off' if a.no_limits else 'on'} seed={a.seed}")
+    results=[await phase("open", [open_one(guild, u, rows) for u in users], rest)]
+    tickets=[(u, guild.get_channel(bot_main.ticket_index.open_for(guild.id, u.id))) for u in users
+             if bot_main.ticket_index.open_for(guild.id, u.id)]
+    results.append(await phase("claim", [claim_one(guild, staff, ch) for _,ch in tickets], rest))
+    results.append(await phase("message", [message_one(guild, u, ch, i) for u,ch in tickets for i in range(a.messages)], rest))
+    await bot_main.activity.flush()
+    results.append(await phase("close", [close_one(guild, u, ch) for u,ch in tickets], rest,
+                               extra_wait=bot_main.close_queue._q.join))
+    await bot_main.close_queue.stop()
+    left=len(bot_main.ticket_index)
+    if left: print(f"  남은 열린 티켓 {left}개"); results[-1]["errors"]+=left
+    return results
+
+def compare(results, baseline, tol):
+    base={r["phase"]: r for r in baseline}; bad=[]
+    for r in results:
+        b=base.get(r["phase"])
+        if not b: continue
+        # 1ms 미만 차이는 잡음으로 봄
+        if r["p95"]>b["p95"]*(1+tol) and r["p95"]-b["p95"]>0.001: bad.append(f"{r['phase']} p95 {b['p95']*1000:.1f}→{r['p95']*1000:.1f}ms")
+        if r["throughput"]<b["throughput"]*(1-tol): bad.append(f"{r['phase']} 처리량 {b['throughput']:.1f}→{r['throughput']:.1f}/s")
+    return bad
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--users", type=int, default=500)
+    ap.add_argument("--messages", type=int, default=20)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--jitter", type=float, default=0.05)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--no-limits", action="store_true", help="레이트 리밋 끔")
+    ap.add_argument("--save", help="결과 JSON 저장 경로")
+    ap.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="허용 악화 비율")
+    a=ap.parse_args()
+    try: results=asyncio.run(run(a))
+    finally: bot_main.dbpool.close()
+    if a.save:
+        with open(a.save, "w", encoding="utf-8") as f: json.dump({"args": vars(a), "results": results}, f, indent=1)
+    ok=all(r["errors"]==0 for r in results)
+    if a.baseline:
+        with open(a.baseline, encoding="utf-8") as f: bad=compare(results, json.load(f)["results"], a.tolerance)
+        for b in bad: print("  회귀:", b)
+        ok=ok and not bad
+    print("OK" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""트랜스크립트 벤치마크: 리스트+join(이전) vs 스트리밍 TranscriptWriter(현재).
+
+가짜 history(100개 단위 페이지)로 메시지 수별 최대 메모리(tracemalloc)와 소요 시간을 잰다.
+
+    python bench/bench_transcript.py --messages 1000 10000 50000
+"""
+import os, io, sys, time, asyncio, argparse, tempfile, tracemalloc
+import datetime as dt
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(prefix="ticketbench-"), "unused.db"))
+import main as bot_main
+
+class FakeAuthor:
+    __slots__=("id","name")
+    def __init__(self, i): self.id=100_000+i; self.name=f"user{i}"
+    def __str__(self): return self.name
+
+class FakeAttachment:
+    __slots__=("url",)
+    def __init__(self, i): self.url=f"https://cdn.discordapp.com/attachments/1/{i}/screenshot.png"
+
+class FakeMessage:
+    __slots__=("created_at","author","content","attachments")
+    def __init__(self, i, base, authors):
+        self.created_at=base+dt.timedelta(seconds=i)
+        self.author=authors[i%len(authors)]
+        self.content=f"메시지 {i} — 로벅스 구매 문의 관련 내용입니다. " * (1+i%4)
+        self.attachments=[FakeAttachment(i)] if i%25==0 else []
+
+class FakeChannel:
+    """discord.TextChannel.history 처럼 100개씩 페이지를 '받아 오는' 가짜 채널.
+    페이지 메시지는 그때그때 만들어 실제 API 처럼 이전 페이지는 참조가 끊긴다."""
+    def __init__(self, n): self.n=n; self.name="ticket-bench"
+    async def history(self, limit=None, oldest_first=True):
+        base=dt.datetime(2025,1,1,tzinfo=dt.timezone.utc); authors=[FakeAuthor(i) for i in range(4)]
+        total=self.n if limit is None else min(limit, self.n)
+        for start in range(0, total, 100):
+            await asyncio.sleep(0)
+            page=[FakeMessage(i, base, authors) for i in range(start, min(start+100, total))]
+            for m in page: yield m
+
+async def legacy(ch):
+    lines=[]
+    async for m in ch.history(limit=None, oldest_first=True):
+        ts=m.created_at.strftime("%Y-%m-%d %H:%M")
+        author=f"{m.author}({m.author.id})"
+        content=m.content or ""
+        if m.attachments: content += " " + " ".join(a.url for a in m.attachments)
+        lines.append(f"[{ts}] {author}: {content}")
+    transcript="\n".join(lines) if lines else "내용 없음"
+    buf=io.BytesIO(transcript.encode("utf-8"))
+    return len(buf.getbuffer())
+
+def streaming(compress):
+    async def run(ch):
+        tw=bot_main.TranscriptWriter(compress)
+        try:
+            await bot_main.stream_transcript(ch, tw)
+            f=tw.finish(); f.seek(0, 2); return f.tell()
+        finally: tw.close()
+    return run
+
+def measure(fn, n):
+    tracemalloc.start()
+    t=time.perf_counter()
+    size=asyncio.run(fn(FakeChannel(n)))
+    wall=time.perf_counter()-t
+    _, peak=tracemalloc.get_traced_memory(); tracemalloc.stop()
+    return wall, peak, size
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--messages", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    a=ap.parse_args()
+    variants=[("before", legacy), ("stream", streaming("none")), ("gzip", streaming("gzip"))]
+    if bot_main.zstandard is not None: variants.append(("zstd", streaming("zstd")))
+    for n in a.messages:
+        print(f"messages={n:,}")
+        for name,fn in variants:
+            wall, peak, size = measure(fn, n)
+            print(f"  {name:7} peak={peak/1024/1024:8.2f} MiB  wall={wall:6.2f}s  output={size/1024:9.1f} KiB")
+
+if __name__ == "__main__":
+    main()
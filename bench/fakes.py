@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""벤치마크용 가짜 discord 객체(Guild/TextChannel/CategoryChannel/Interaction)와 가짜 게이트웨이.
+
+main.py 의 isinstance 검사를 통과하도록 TextChannel/CategoryChannel 은 실제 클래스를 상속하고,
+REST 호출은 RestSim 이 정한 인공 지연(+선택 지터/레이트 리밋)만큼 기다린 뒤 메모리에서 처리한다.
+FakeGateway 는 실제 discord.py 클라이언트가 접속하는 로컬 HTTP/웹소켓 서버.
+"""
+import asyncio, itertools, collections, random, time, json
+import datetime as dt
+import discord
+from aiohttp import web, WSMsgType
+
+_ids = itertools.count(10**17)
+def next_id() -> int: return next(_ids)
+
+class RestSim:
+    """가짜 REST 계층. 호출마다 latency(+0~jitter) 초 대기, 라우트별 호출 수 집계.
+    limits={"create": (5, 5.0)} 처럼 라우트 종류(":" 앞)별 (횟수, 초) 버킷을 주면 라우트(종류:ID)마다
+    창 안에서 횟수를 넘는 호출은 429 로 세고 창이 빌 때까지 기다린다(discord.py 의 자동 재시도처럼)."""
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, limits: dict|None = None, seed: int = 1):
+        self.latency=latency; self.jitter=jitter; self.limits=limits or {}
+        self.calls: collections.Counter = collections.Counter()
+        self.ratelimited: collections.Counter = collections.Counter()
+        self._windows: dict[str, collections.deque] = {}
+        self._rng=random.Random(seed)
+    async def call(self, route: str):
+        self.calls[route]+=1
+        lim=self.limits.get(route.split(":", 1)[0])
+        if lim:
+            n, per = lim
+            w=self._windows.setdefault(route, collections.deque())
+            while True:
+                now=time.monotonic()
+                while w and w[0]<=now-per: w.popleft()
+                if len(w)<n: w.append(now); break
+                self.ratelimited[route.split(":", 1)[0]]+=1
+                await asyncio.sleep(w[0]+per-now)
+        d=self.latency+(self._rng.random()*self.jitter if self.jitter else 0.0)
+        if d: await asyncio.sleep(d)
+
+class FakeRole:
+    def __init__(self, guild, name="staff"):
+        self.id=next_id(); self.name=name; self.guild=guild; self.members=[]
+    @property
+    def mention(self): return f"<@&{self.id}>"
+    def __repr__(self): return f"<FakeRole {self.name}>"
+
+class FakeMember:
+    def __init__(self, guild, name, roles=(), admin=False):
+        self.id=next_id(); self.name=name; self.guild=guild; self.bot=False
+        self.roles=list(roles)
+        self.guild_permissions=discord.Permissions.all() if admin else discord.Permissions.none()
+        for r in self.roles: r.members.append(self)
+    @property
+    def mention(self): return f"<@{self.id}>"
+    def __str__(self): return self.name
+
+class FakeAttachment:
+    def __init__(self, url, filename="file.png", size=0):
+        self.id=next_id(); self.url=url; self.filename=filename; self.size=size
+
+class FakeMessage:
+    def __init__(self, channel, author, content="", embed=None, attachments=()):
+        self.id=next_id(); self.channel=channel; self.author=author; self.content=content or ""
+        self.embeds=[embed] if embed else []; self.attachments=list(attachments)
+        self.created_at=dt.datetime.now(dt.timezone.utc); self.guild=channel.guild
+        self._state=None  # commands.Context 가 읽기만 함
+
+class FakeCategory(discord.CategoryChannel):
+    def __init__(self, guild, name="tickets"):
+        self.id=next_id(); self.name=name; self.guild=guild; self.position=0
+    @property
+    def text_channels(self):
+        return [c for c in self.guild.channels.values() if isinstance(c, FakeTextChannel) and c.category_id==self.id]
+
+class FakeTextChannel(discord.TextChannel):
+    def __init__(self, guild, name, category=None, topic=None):
+        self.id=next_id(); self.name=name; self.guild=guild; self.topic=topic
+        self.category_id=category.id if category else None; self.position=0
+        self.messages: list[FakeMessage]=[]; self.deleted=False
+    async def send(self, content=None, *, embed=None, view=None, file=None, **kw):
+        await self.guild.rest.call(f"send:{self.id}")
+        if file is not None: file.close()
+        m=FakeMessage(self, self.guild.me, content, embed); self.messages.append(m); return m
+    async def edit(self, *, name=None, reason=None, **kw):
+        await self.guild.rest.call(f"edit:{self.id}")
+        if name: self.name=name
+    async def set_permissions(self, target, **kw):
+        await self.guild.rest.call(f"perm:{self.id}")
+    async def delete(self, *, reason=None):
+        await self.guild.rest.call(f"delete:{self.guild.id}")
+        self.deleted=True; self.guild.channels.pop(self.id, None)
+    async def history(self, limit=None, oldest_first=True):
+        for i in range(0, len(self.messages), 100):
+            await self.guild.rest.call(f"history:{self.id}")
+            for m in self.messages[i:i+100]: yield m
+
+class FakeGuild:
+    def __init__(self, rest: RestSim|None = None, name="bench", gid: int|None = None):
+        self.id=gid or next_id(); self.name=name; self.rest=rest or RestSim()
+        self.channels: dict[int, object]={}; self.roles: dict[int, FakeRole]={}
+        self.default_role=FakeRole(self, "@everyone"); self.roles[self.default_role.id]=self.default_role
+        self.me=FakeMember(self, "ticketbot"); self.me.bot=True
+    def add_role(self, name):
+        r=FakeRole(self, name); self.roles[r.id]=r; return r
+    def add_category(self, name="tickets"):
+        c=FakeCategory(self, name); self.channels[c.id]=c; return c
+    def get_role(self, rid): return self.roles.get(rid)
+    def get_channel(self, cid): return self.channels.get(cid)
+    async def create_text_channel(self, name, *, category=None, overwrites=None, topic=None, reason=None, **kw):
+        await self.rest.call(f"create:{self.id}")
+        ch=FakeTextChannel(self, name, category, topic); self.channels[ch.id]=ch; return ch
+
+class FakeResponse:
+    """상호작용 응답(콜백 엔드포인트)도 REST 왕복 한 번으로 침"""
+    def __init__(self, inter): self._inter=inter; self._done=False; self.modal=None
+    def is_done(self): return self._done
+    async def send_message(self, content=None, *, embed=None, ephemeral=False, **kw):
+        self._done=True; await self._inter.guild.rest.call(f"callback:{self._inter.id}")
+        self._inter.sent.append(content or (embed.title if embed else ""))
+    async def defer(self, *, ephemeral=False, **kw):
+        self._done=True; await self._inter.guild.rest.call(f"callback:{self._inter.id}")
+    async def send_modal(self, modal):
+        self._done=True; await self._inter.guild.rest.call(f"callback:{self._inter.id}"); self.modal=modal
+
+class FakeFollowup:
+    def __init__(self, inter): self._inter=inter
+    async def send(self, content=None, *, embed=None, ephemeral=False, **kw):
+        await self._inter.guild.rest.call(f"followup:{self._inter.id}")
+        self._inter.sent.append(content or (embed.title if embed else ""))
+
+class FakeInteraction:
+    def __init__(self, guild: FakeGuild, user: FakeMember, channel=None):
+        self.id=next_id(); self.guild=guild; self.guild_id=guild.id; self.user=user; self.channel=channel
+        self.response=FakeResponse(self); self.followup=FakeFollowup(self); self.sent: list[str]=[]
+
+class FakeGateway:
+    """가짜 디스코드 REST + 게이트웨이(aiohttp, 127.0.0.1 임의 포트). 실제 discord.py(AutoShardedBot)가 붙도록
+    로그인 / HELLO·IDENTIFY·READY / GUILD_CREATE / 멤버 청크 / 하트비트만 흉내 내고 나머지 REST 는 빈 응답.
+    길드는 IDENTIFY 의 [shard, count] 로 샤드 공식((id>>22)%count)대로 골라 보낸다.
+    클라이언트는 discord.http.Route.BASE=url+"/api/v10", DiscordWebSocket.DEFAULT_GATEWAY=ws_url 로 돌려 붙인다."""
+    APP_ID=10**17-1
+    USER={"id": str(10**17-1), "username": "ticketbot", "discriminator": "0", "global_name": None, "avatar": None, "bot": True}
+
+    def __init__(self, guild_ids):
+        self.guild_ids=list(guild_ids)
+        self.identifies: collections.Counter = collections.Counter()  # 샤드 → IDENTIFY 횟수
+        self.identified_at: dict[int, float] = {}                      # 샤드 → 마지막 IDENTIFY 시각(monotonic)
+        self.sent: dict[int, set] = collections.defaultdict(set)       # 샤드 → 보낸 길드
+        self.rest: collections.Counter = collections.Counter()         # "METHOD 경로" → 호출 수
+        self.hellos: list[tuple[float,int,str]]=[]                    # 워커가 알린 (시각, pid, 샤드)
+        self.url=self.ws_url=None; self._runner=None
+
+    async def start(self):
+        app=web.Application()
+        app.router.add_get("/gateway", self._ws)
+        app.router.add_get("/bench/hello", self._hello)
+        app.router.add_route("*", "/api/v10/{tail:.*}", self._api)
+        self._runner=web.AppRunner(app); await self._runner.setup()
+        site=web.TCPSite(self._runner, "127.0.0.1", 0); await site.start()
+        port=site._server.sockets[0].getsockname()[1]
+        self.url=f"http://127.0.0.1:{port}"; self.ws_url=f"ws://127.0.0.1:{port}/gateway"
+        return self
+
+    async def stop(self):
+        if self._runner: await self._runner.cleanup()
+
+    async def _hello(self, req):
+        self.hellos.append((time.monotonic(), int(req.query["pid"]), req.query["shards"]))
+        return web.Response(text="ok")
+
+    @staticmethod
+    def _json(data):
+        # discord.py 는 Content-Type 이 정확히 application/json 일 때만 JSON 으로 읽음(charset 붙으면 문자열)
+        return web.Response(body=json.dumps(data).encode(), headers={"Content-Type": "application/json"})
+
+    async def _api(self, req):
+        path=req.match_info["tail"]; self.rest[f"{req.method} {path}"]+=1
+        if path=="users/@me": return self._json(self.USER)
+        if path=="oauth2/applications/@me":
+            owner={**self.USER, "id": "1", "username": "owner", "bot": False}
+            return self._json({"id": str(self.APP_ID), "name": "ticketbot", "description": "", "icon": None, "bot_public": False,
+                               "bot_require_code_grant": False, "owner": owner, "verify_key": "", "flags": 0})
+        if path=="gateway/bot":
+            return self._json({"url": self.ws_url, "shards": 1, "session_start_limit":
+                               {"total": 1000, "remaining": 1000, "reset_after": 0, "max_concurrency": 16}})
+        return self._json([] if req.method in ("GET", "PUT") else {})  # 커맨드 싱크 등은 빈 결과
+
+    def _guild(self, gid):
+        everyone={"id": str(gid), "name": "@everyone", "permissions": "0", "position": 0, "color": 0,
+                  "hoist": False, "managed": False, "mentionable": False}
+        return {"id": str(gid), "name": f"guild-{gid}", "owner_id": "1", "roles": [everyone], "channels": [], "threads": [],
+                "members": [], "member_count": 0, "emojis": [], "stickers": [], "features": [], "large": False,
+                "unavailable": False, "premium_tier": 0, "preferred_locale": "ko", "voice_states": [], "presences": []}
+
+    async def _ws(self, req):
+        ws=web.WebSocketResponse(); await ws.prepare(req)
+        seq=0
+        async def send(op, d=None, t=None):
+            nonlocal seq
+            if op==0: seq+=1
+            await ws.send_str(json.dumps({"op": op, "d": d, "s": seq if op==0 else None, "t": t}))
+        await send(10, {"heartbeat_interval": 41250})
+        async for msg in ws:
+            if msg.type!=WSMsgType.TEXT: continue
+            p=json.loads(msg.data); op=p.get("op"); d=p.get("d") or {}
+            if op==1:
+                # RTT 0 이면 discord.py 하트비트 스레드가 보낸 시각을 적기 전에 ACK 가 와서 지연이 주기만큼으로 잡힘
+                await asyncio.sleep(0.02); await send(11)
+            elif op==2:
+                sid,count=d.get("shard") or (0, 1)
+                self.identifies[sid]+=1; self.identified_at[sid]=time.monotonic()
+                mine=[g for g in self.guild_ids if (g>>22)%count==sid]
+                self.sent[sid].update(mine)
+                await send(0, {"v": 10, "user": self.USER, "guilds": [{"id": str(g), "unavailable": True} for g in mine],
+                               "session_id": f"s{sid}-{self.identifies[sid]}", "resume_gateway_url": self.ws_url,
+                               "shard": [sid, count], "application": {"id": str(self.APP_ID), "flags": 0}}, "READY")
+                for g in mine: await send(0, self._guild(g), "GUILD_CREATE")
+            elif op==8:
+                gids=d.get("guild_id"); gids=gids if isinstance(gids, list) else [gids]
+                for g in gids:
+                    await send(0, {"guild_id": str(g), "members": [], "chunk_index": 0, "chunk_count": 1,
+                                   "nonce": d.get("nonce")}, "GUILD_MEMBERS_CHUNK")
+        return ws